@@ -4,9 +4,32 @@ Generates the Pokemon asset pack manifest from the legacy pokemon.json format.
 Run this once to migrate to the new pack-based system.
 """
 
-import json
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+
+def _variants(number, data):
+    """Returns the model/icon variants for one Pokemon entry."""
+    name = data["name"]
+    variants = {
+        "default": {
+            "model": f"{number}_{name}.glb",
+            "icon": f"{number}_{name}.png"
+        }
+    }
+    if data.get("has_shiny", False):
+        variants["shiny"] = {
+            "model": f"{number}_{name}_shiny.glb",
+            "icon": f"{number}_{name}_shiny.png"
+        }
+    return variants
+
+
 def main():
     # Paths
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -15,47 +38,32 @@ def main():
     manifest_path = os.path.join(project_root, "user_assets", "pokemon", "manifest.json")
     
     # Read legacy pokemon.json
-    with open(pokemon_json_path, "r", encoding="utf-8") as f:
-        pokemon_data = json.load(f)
+    with open(pokemon_json_path, "rb") as f:
+        raw = f.read()
+    pokemon_data = orjson.loads(raw) if orjson else json.loads(raw)
     
-    # Build manifest
+    # Build manifest. Asset IDs use the pokemon number for uniqueness.
     manifest = {
         "pack_id": "pokemon",
         "display_name": "Pokemon",
         "version": "1.0",
-        "assets": {}
-    }
-    
-    for number, data in pokemon_data.items():
-        name = data["name"]
-        has_shiny = data.get("has_shiny", False)
-        
-        # Asset ID uses the pokemon number for uniqueness
-        asset_id = number
-        
-        # Build variants
-        variants = {
-            "default": {
-                "model": f"{number}_{name}.glb",
-                "icon": f"{number}_{name}.png"
+        "assets": {
+            number: {
+                "display_name": data["name"].replace("-", " ").title(),
+                "variants": _variants(number, data)
             }
+            for number, data in pokemon_data.items()
         }
-        
-        if has_shiny:
-            variants["shiny"] = {
-                "model": f"{number}_{name}_shiny.glb",
-                "icon": f"{number}_{name}_shiny.png"
-            }
-        
-        manifest["assets"][asset_id] = {
-            "display_name": name.replace("-", " ").title(),
-            "variants": variants
-        }
+    }
     
     # Write manifest
     os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
-    with open(manifest_path, "w", encoding="utf-8") as f:
-        json.dump(manifest, f, indent=2)
+    if orjson:
+        with open(manifest_path, "wb") as f:
+            f.write(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+    else:
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
     
     print(f"Generated manifest with {len(manifest['assets'])} assets")
     print(f"Manifest written to: {manifest_path}")
@@ -30,12 +30,20 @@ def main():
     hook_source = os.path.join(script_dir, "pre-commit")
     hook_dest = os.path.join(git_hooks_dir, "pre-commit")
 
-    if not os.path.isfile(hook_source):
+    try:
+        source_st = os.stat(hook_source)
+    except FileNotFoundError:
+        source_st = None
+    if source_st is None or not stat.S_ISREG(source_st.st_mode):
         print(f"Error: Hook source not found: {hook_source}", file=sys.stderr)
         sys.exit(1)
 
-    # Remove existing hook if present
-    if os.path.exists(hook_dest) or os.path.islink(hook_dest):
+    # Remove existing hook if present (lstat also sees dangling symlinks)
+    try:
+        os.lstat(hook_dest)
+    except FileNotFoundError:
+        pass
+    else:
         os.remove(hook_dest)
         print(f"Removed existing hook: {hook_dest}")
 
@@ -52,9 +60,8 @@ def main():
         rel_for_symlink = os.path.relpath(hook_source, git_hooks_dir)
         os.symlink(rel_for_symlink, hook_dest)
 
-    # Ensure executable
-    st = os.stat(hook_dest)
-    os.chmod(hook_dest, st.st_mode | stat.S_IEXEC | stat.S_IXGRP | stat.S_IXOTH)
+        # Ensure executable (chmod follows the symlink, so this is hook_source's mode)
+        os.chmod(hook_dest, source_st.st_mode | stat.S_IEXEC | stat.S_IXGRP | stat.S_IXOTH)
 
     print(f"Installed pre-commit hook: {hook_dest}")
     print("Audio files in assets/audio/ will be auto-normalized on commit.")
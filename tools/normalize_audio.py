@@ -9,6 +9,8 @@ so that every file — even tiny clicks — gets consistent levels.
 Requirements:
     - ffmpeg must be installed and on PATH
     - Python 3.8+
+    - Optional: pyloudnorm + soundfile (pip install pyloudnorm soundfile) to measure
+      loudness in-process instead of spawning ffmpeg for the measurement pass
 
 Usage:
     python tools/normalize_audio.py                 # Normalize all audio files
@@ -16,19 +18,44 @@ Usage:
     python tools/normalize_audio.py --peak -3       # Custom peak target for short files (default: -3)
     python tools/normalize_audio.py --dry-run       # Preview what would be processed
     python tools/normalize_audio.py --backup        # Keep originals as .bak files
+    python tools/normalize_audio.py --fast          # Single-pass loudnorm (two-pass if it misses)
+    python tools/normalize_audio.py --verify        # Report levels after normalizing
+    python tools/normalize_audio.py --no-cache      # Re-measure files even if unchanged
+    python tools/normalize_audio.py --jobs 4        # Process 4 files in parallel (default: CPU count)
+    python tools/normalize_audio.py --serial        # Process one file at a time
+    python tools/normalize_audio.py --batch-size 1  # One ffmpeg run per file
+    python tools/normalize_audio.py --no-verify-ffmpeg  # Only look ffmpeg up on PATH
 """
 
 import argparse
+import collections
 import json
 import math
 import os
+import re
 import shutil
+import stat
 import subprocess
 import sys
 import tempfile
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Optional: in-process EBU R128 measurement (falls back to ffmpeg's loudnorm)
+try:
+    import numpy
+    import pyloudnorm
+    import scipy.signal
+    import soundfile
+except ImportError:
+    pyloudnorm = None
 
 # Supported audio extensions
 AUDIO_EXTENSIONS = {".wav", ".ogg", ".mp3", ".opus"}
+_EXTENSIONS_NO_DOT = {ext[1:] for ext in AUDIO_EXTENSIONS}
+
+# Prefix for in-progress output files, created next to the file being normalized
+TEMP_PREFIX = ".normalize_"
 
 # Default loudness target (LUFS) — good range for game SFX is -16 to -20
 DEFAULT_TARGET_LUFS = -18
@@ -49,62 +76,325 @@ DEFAULT_PEAK_TARGET = -3.0
 LUFS_TOLERANCE = 1.5
 PEAK_TOLERANCE = 1.5
 
+# Shortest file measured in-process with pyloudnorm (see measure_loudness_in_process)
+IN_PROCESS_MIN_SECONDS = 1.0
+
+# ffmpeg stderr kept per run (see run_ffmpeg): 32 x 64 KB is ample for the
+# trailing loudnorm reports, however much progress output precedes them
+STDERR_CHUNK_SIZE = 64 * 1024
+STDERR_TAIL_CHUNKS = 32
+
+# Filter graph threads per ffmpeg process. Audio filter chains gain little from
+# more; with parallel workers each process gets 1 (see _filter_thread_args)
+AUDIO_FILTER_THREADS = 2
+
+# Number of ffmpeg processes running at once. Set by set_parallel_jobs(),
+# in the main process and via the pool initializer in each worker.
+_parallel_jobs = 1
+
+# Measurement cache, relative to the project root. Files whose size and mtime
+# match a cached measurement that is already within target aren't re-measured.
+CACHE_PATH = os.path.join("assets", "audio", ".audio_norm_cache.json")
+
+# Files measured / normalized per ffmpeg run. Every file is its own input (and
+# output) in one command, so ffmpeg startup is paid once per batch instead of
+# once per file. The cap keeps the command line well within platform limits.
+DEFAULT_BATCH_SIZE = 8
+MAX_BATCH_SIZE = 32
+
+# Filter graphs at least this long are passed to ffmpeg in a script file rather
+# than on the command line (see _filter_complex_args)
+FILTER_SCRIPT_MIN_CHARS = 2048
+
+# Remembers the ffmpeg binary that last passed check_ffmpeg (path -> mtime_ns)
+FFMPEG_CHECK_CACHE = os.path.join(os.path.expanduser("~"), ".cache", "tt-sim", "ffmpeg_ok")
+
 
 def find_audio_files(audio_dir: str) -> list[str]:
     """Recursively find all audio files under the given directory."""
-    files = []
-    for root, _dirs, filenames in os.walk(audio_dir):
-        for filename in sorted(filenames):
-            ext = os.path.splitext(filename)[1].lower()
-            if ext in AUDIO_EXTENSIONS:
-                files.append(os.path.join(root, filename))
-    return files
+    return sorted(_iter_audio_files(audio_dir))
+
+
+def _iter_audio_files(directory: str):
+    """Yield audio file paths under directory (unsorted). DirEntry type checks avoid extra stats."""
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        return  # Unreadable directory: skip it, like os.walk does
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_audio_files(entry.path)
+            elif (
+                entry.name.rpartition(".")[2].lower() in _EXTENSIONS_NO_DOT
+                and not entry.name.startswith(TEMP_PREFIX)
+                and entry.is_file()
+            ):
+                yield entry.path
+
+
+def check_ffmpeg(verify: bool = True) -> bool:
+    """
+    Verify ffmpeg is available. A successful `ffmpeg -version` is recorded in
+    FFMPEG_CHECK_CACHE keyed by the binary's path and mtime, so later runs only
+    look it up on PATH and stat it until it's moved or upgraded. With
+    verify=False, finding it on PATH is enough.
+    """
+    path = shutil.which("ffmpeg")
+    if path is None:
+        return False
+    if not verify:
+        return True
 
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return False
+    try:
+        with open(FFMPEG_CHECK_CACHE, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if isinstance(cached, dict) and cached.get(path) == mtime_ns:
+            return True
+    except (OSError, ValueError):
+        pass
 
-def check_ffmpeg() -> bool:
-    """Verify ffmpeg is available."""
     try:
         result = subprocess.run(
-            ["ffmpeg", "-version"],
+            ["ffmpeg", "-hide_banner", "-version"],
             capture_output=True,
             text=True,
         )
-        return result.returncode == 0
-    except FileNotFoundError:
+    except OSError:
+        return False
+    if result.returncode != 0:
         return False
 
+    try:
+        os.makedirs(os.path.dirname(FFMPEG_CHECK_CACHE), exist_ok=True)
+        with open(FFMPEG_CHECK_CACHE, "w", encoding="utf-8") as f:
+            json.dump({path: mtime_ns}, f)
+    except OSError:
+        pass  # Not cached; checked again next run
+    return True
+
+
+def run_ffmpeg(cmd: list[str], pass_fds: tuple[int, ...] = ()) -> tuple[int, str]:
+    """
+    Run an ffmpeg command and return (returncode, stderr_tail). pass_fds are
+    inherited by ffmpeg (for /proc/self/fd/<n> outputs, see _open_temp_output).
+
+    Only the last STDERR_TAIL_CHUNKS * STDERR_CHUNK_SIZE bytes of stderr are kept
+    and decoded: the loudnorm reports we parse are printed at the very end, and
+    progress/log output for long files can otherwise run to megabytes.
+    """
+    tail = collections.deque(maxlen=STDERR_TAIL_CHUNKS)
+    with subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        bufsize=1 << 20,
+        pass_fds=pass_fds,
+    ) as proc:
+        while chunk := proc.stderr.read(STDERR_CHUNK_SIZE):
+            tail.append(chunk)
+    return proc.returncode, b"".join(tail).decode("utf-8", errors="replace")
+
+
+def _log_args(reports: bool) -> list[str]:
+    """
+    Global options keeping ffmpeg's stderr to what we read: no banner or progress
+    stats, and warnings only unless the loudnorm/astats reports (info level) are needed.
+    """
+    return ["-hide_banner", "-nostats", "-loglevel", "info" if reports else "warning"]
+
+
+def set_parallel_jobs(jobs: int) -> None:
+    """Record how many ffmpeg processes run concurrently (also a pool initializer)."""
+    global _parallel_jobs
+    _parallel_jobs = jobs
+
+
+def _codec_thread_args() -> list[str]:
+    """
+    Per-input/output -threads option. When several ffmpeg processes run side by
+    side each gets one codec thread so they don't oversubscribe the cores;
+    a lone process lets ffmpeg pick (0 = auto).
+    """
+    return ["-threads", "1" if _parallel_jobs > 1 else "0"]
+
+
+def _filter_thread_args() -> list[str]:
+    """Global filter graph thread options, capped at AUDIO_FILTER_THREADS."""
+    threads = "1" if _parallel_jobs > 1 else str(AUDIO_FILTER_THREADS)
+    return ["-filter_threads", threads, "-filter_complex_threads", threads]
+
+
+def _input_args(filepath: str) -> list[str]:
+    """
+    ffmpeg options for reading one audio input. -vn/-sn drop video (e.g. MP3
+    cover art) and subtitle streams at the demuxer so they're never probed,
+    decoded or auto-selected for an output.
+    """
+    return [*_codec_thread_args(), "-vn", "-sn", "-i", filepath]
+
+
+def _filter_complex_args(graph: str, scripts: list[str]) -> list[str]:
+    """
+    ffmpeg options passing a filter_complex graph. Large (batched) graphs are
+    written to a temp script file instead of argv, keeping the command line well
+    under platform limits; its path is appended to scripts for the caller to delete.
+    """
+    if len(graph) < FILTER_SCRIPT_MIN_CHARS:
+        return ["-filter_complex", graph]
+    fd, script_path = tempfile.mkstemp(prefix=TEMP_PREFIX, suffix=".txt")
+    scripts.append(script_path)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(graph)
+    # Deprecated in ffmpeg 7 in favour of -/filter_complex, which 4.x/5.x lack
+    return ["-filter_complex_script", script_path]
+
 
 def get_codec_args(ext: str) -> list[str]:
-    """Return ffmpeg codec arguments for the given file extension."""
+    """
+    Return ffmpeg codec and muxer arguments for the given file extension. The
+    muxer is explicit because a /proc/self/fd/<n> output path has no extension
+    to go by.
+    """
     if ext == ".ogg":
-        return ["-c:a", "libvorbis", "-q:a", "6"]
+        return ["-c:a", "libvorbis", "-q:a", "6", "-f", "ogg"]
     elif ext == ".opus":
-        return ["-c:a", "libopus", "-b:a", "128k"]
+        return ["-c:a", "libopus", "-b:a", "128k", "-f", "opus"]
     elif ext == ".mp3":
-        return ["-c:a", "libmp3lame", "-q:a", "2"]
+        return ["-c:a", "libmp3lame", "-q:a", "2", "-f", "mp3"]
     else:
-        # WAV — PCM output
-        return ["-c:a", "pcm_s16le"]
+        # WAV — PCM output; -bitexact leaves out the encoder-tag LIST chunk
+        return ["-c:a", "pcm_s16le", "-f", "wav", "-bitexact"]
 
 
 def measure_loudness(filepath: str, target_lufs: float) -> dict | None:
     """
-    First pass: measure the file's loudness using ffmpeg's loudnorm filter.
-    Returns the measured values needed for the second (normalization) pass.
+    First pass: measure the file's loudness, in-process when possible and
+    otherwise with ffmpeg's loudnorm filter. Returns the measured values needed
+    for the second (normalization) pass, in loudnorm's report format.
+
+    The ffmpeg run also feeds the decoded audio through astats (on 4x-oversampled
+    audio, like loudnorm's true peak): for clips too short for LUFS, where
+    loudnorm reports input_i -inf, its peak is used, so one decode covers both
+    the LUFS and the peak path.
     """
+    measurements = measure_loudness_in_process(filepath)
+    if measurements is not None:
+        return measurements
+
+    graph = (
+        "[0:a]asplit=2[ln][pk];"
+        f"[ln]loudnorm=I={target_lufs}:TP={TRUE_PEAK_LIMIT}:LRA={LOUDNESS_RANGE}"
+        ":print_format=json[m];"
+        "[pk]aresample=192000,astats=measure_perchannel=none:measure_overall=Peak_level[p]"
+    )
     cmd = [
-        "ffmpeg", "-i", filepath,
-        "-af", f"loudnorm=I={target_lufs}:TP={TRUE_PEAK_LIMIT}:LRA={LOUDNESS_RANGE}:print_format=json",
+        "ffmpeg", *_log_args(reports=True), *_filter_thread_args(),
+        *_input_args(filepath),
+        "-filter_complex", graph,
+        "-map", "[m]", "-map", "[p]",
         "-f", "null", "-"
     ]
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    returncode, stderr = run_ffmpeg(cmd)
 
-    if result.returncode != 0:
+    if returncode != 0:
         return None
 
+    reports = parse_loudnorm_reports(stderr)
+    measurements = reports[0] if reports else None
+    if measurements is not None and not is_lufs_valid(measurements):
+        peak = re.search(r"Peak level dB: (\S+)", stderr)
+        if peak is not None:
+            measurements["input_tp"] = f"{float(peak.group(1)):.2f}"
+    return measurements
+
+
+def measure_loudness_batch(filepaths: list[str], target_lufs: float) -> list[dict | None]:
+    """
+    Measure several files, like measure_loudness, with one ffmpeg run for all
+    the files that can't be measured in-process. Each file is its own input with
+    its own loudnorm chain in a single filter graph, all mapped to one null output.
+    Falls back to one run per file if the combined run fails.
+    """
+    results = [measure_loudness_in_process(filepath) for filepath in filepaths]
+    remaining = [index for index, measurements in enumerate(results) if measurements is None]
+
+    if len(remaining) == 1:
+        results[remaining[0]] = measure_loudness(filepaths[remaining[0]], target_lufs)
+    elif remaining:
+        loudnorm = f"loudnorm=I={target_lufs}:TP={TRUE_PEAK_LIMIT}:LRA={LOUDNESS_RANGE}:print_format=json"
+        cmd = ["ffmpeg", *_log_args(reports=True), *_filter_thread_args()]
+        for index in remaining:
+            cmd += _input_args(filepaths[index])
+        graph = ";".join(f"[{i}:a]{loudnorm}[m{i}]" for i in range(len(remaining)))
+        scripts = []
+        try:
+            cmd += _filter_complex_args(graph, scripts)
+            for i in range(len(remaining)):
+                cmd += ["-map", f"[m{i}]"]
+            cmd += ["-f", "null", "-"]
+
+            returncode, stderr = run_ffmpeg(cmd)
+        finally:
+            for script_path in scripts:
+                os.unlink(script_path)
+
+        # One loudnorm per chain, so reports (ordered by filter index) line up with inputs
+        reports = parse_loudnorm_reports(stderr) if returncode == 0 else []
+
+        if len(reports) == len(remaining):
+            for index, measurements in zip(remaining, reports):
+                results[index] = measurements
+        else:
+            for index in remaining:
+                results[index] = measure_loudness(filepaths[index], target_lufs)
+
+    return results
+
+
+def measure_loudness_in_process(filepath: str) -> dict | None:
+    """
+    Measure integrated loudness and true peak without spawning ffmpeg, using
+    pyloudnorm (EBU R128) on audio decoded by soundfile. Returns the same keys
+    as the loudnorm report, or None if the optional packages are missing,
+    soundfile can't decode the file (e.g. Opus on older libsndfile builds) or it
+    has more than the five channels pyloudnorm supports.
+
+    Clips under IN_PROCESS_MIN_SECONDS are left to ffmpeg: with only a few
+    400ms gating blocks, pyloudnorm and loudnorm can disagree by more than
+    LUFS_TOLERANCE, and results shouldn't depend on which packages are installed.
+    That includes clips too short for LUFS: scipy's oversampled peak can differ
+    from ffmpeg's by a few tenths of a dB.
+    """
+    if pyloudnorm is None:
+        return None
+
+    try:
+        data, sample_rate = soundfile.read(filepath, dtype="float32", always_2d=True)
+    except RuntimeError:  # soundfile.LibsndfileError on newer releases
+        return None
+    if len(data) < IN_PROCESS_MIN_SECONDS * sample_rate or data.shape[1] > 5:
+        return None
+
+    integrated = pyloudnorm.Meter(sample_rate).integrated_loudness(data)
+
+    # True peak: 4x oversampled sample peak (as in ITU-R BS.1770)
+    oversampled = scipy.signal.resample_poly(data, 4, 1, axis=0)
+    peak = float(numpy.max(numpy.abs(oversampled)))
+    true_peak = 20 * math.log10(peak) if peak > 0 else float("-inf")
+
+    return {"input_i": f"{integrated:.2f}", "input_tp": f"{true_peak:.2f}"}
+
+
+def parse_loudnorm_json(stderr: str) -> dict | None:
+    """Extract the loudnorm filter's print_format=json block from ffmpeg's stderr."""
     # The loudnorm JSON is printed at the end of stderr
-    stderr = result.stderr
     # Find the JSON block (between the last { and })
     json_start = stderr.rfind("{")
     json_end = stderr.rfind("}") + 1
@@ -117,6 +407,35 @@ def measure_loudness(filepath: str, target_lufs: float) -> dict | None:
         return None
 
 
+def parse_loudnorm_reports(stderr: str) -> list[dict | None]:
+    """
+    Extract every loudnorm JSON report from ffmpeg's stderr, ordered by the
+    filter's position in the graph (ffmpeg prints them in teardown order).
+    """
+    matches = list(re.finditer(r"\[Parsed_loudnorm_(\d+) @ [^\]]*\]", stderr))
+    reports = []
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(stderr)
+        reports.append((int(match.group(1)), parse_loudnorm_json(stderr[match.end():end])))
+    reports.sort(key=lambda report: report[0])
+    return [stats for _index, stats in reports]
+
+
+def probe_sample_rate(filepath: str) -> int | None:
+    """
+    Read the input's sample rate from ffmpeg's stream info (header only, no decode).
+    Needed by the single-pass path because loudnorm resamples its output to 192 kHz.
+    """
+    # With no output file ffmpeg exits non-zero, but has already printed the stream info
+    result = subprocess.run(
+        ["ffmpeg", "-hide_banner", "-i", filepath],
+        capture_output=True,
+        text=True,
+    )
+    match = re.search(r"Audio: .*?, (\d+) Hz", result.stderr)
+    return int(match.group(1)) if match else None
+
+
 def is_lufs_valid(measurements: dict) -> bool:
     """Check whether the LUFS measurement is usable (not -inf / inf)."""
     try:
@@ -139,85 +458,323 @@ def get_peak_db(measurements: dict) -> float | None:
 # LUFS normalization (for files long enough for EBU R128)
 # ---------------------------------------------------------------------------
 
-def normalize_lufs(
-    filepath: str,
-    current_lufs: float,
-    target_lufs: float,
-    backup: bool = False,
-) -> bool:
+def lufs_gain_filter(current_lufs: float, target_lufs: float) -> str:
     """
-    Normalize a file by applying the exact gain needed to reach the LUFS target,
+    Build the filter that applies the exact gain needed to reach the LUFS target,
     with a hard limiter to prevent clipping. More reliable for short game SFX
     than ffmpeg's loudnorm two-pass mode.
     """
-    ext = os.path.splitext(filepath)[1].lower()
     gain_db = target_lufs - current_lufs
 
     # Apply gain and hard-limit to prevent peaks exceeding the ceiling
-    af = f"volume={gain_db}dB,alimiter=limit={TRUE_PEAK_LIMIT}dB:attack=0.1:release=50"
+    return f"volume={gain_db}dB,alimiter=limit={TRUE_PEAK_LIMIT}dB:attack=0.1:release=50"
+
+
+def normalize_lufs_single_pass(
+    filepath: str,
+    target_lufs: float,
+    backup: bool = False,
+) -> tuple[bool, dict | None]:
+    """
+    Normalize in one ffmpeg run using loudnorm's dynamic (single-pass) mode,
+    skipping the separate measurement pass. Usually lands within ±1 LUFS, but
+    the dynamic mode can miss by several LUFS on short or very dynamic clips.
+
+    Returns (ok, stats) where stats is loudnorm's JSON report: input_i/input_tp
+    describe the original file, output_i the result. The file is left untouched
+    (ok is False) when it is too short for LUFS, already within tolerance, or the
+    result would be LUFS_TOLERANCE or more off target.
+    """
+    ext = os.path.splitext(filepath)[1].lower()
+    sample_rate = probe_sample_rate(filepath)
+    if sample_rate is None:
+        return False, None
+
+    af = (
+        f"loudnorm=I={target_lufs}:TP={TRUE_PEAK_LIMIT}:LRA={LOUDNESS_RANGE}"
+        ":print_format=json"
+    )
+
+    def accept(stats: dict | None) -> bool:
+        if (
+            stats is None
+            or not is_lufs_valid(stats)
+            or abs(float(stats["input_i"]) - target_lufs) < LUFS_TOLERANCE
+        ):
+            return False
+        try:
+            return abs(float(stats["output_i"]) - target_lufs) < LUFS_TOLERANCE
+        except (ValueError, KeyError, TypeError):
+            return False
 
-    return _apply_filter(filepath, af, ext, backup)
+    # loudnorm always outputs 192 kHz; resample back to the source rate
+    return _apply_filter(
+        filepath, af, ext, backup,
+        extra_args=["-ar", str(sample_rate)],
+        accept=accept,
+    )
 
 
 # ---------------------------------------------------------------------------
 # Peak normalization (fallback for very short files)
 # ---------------------------------------------------------------------------
 
-def normalize_peak(
-    filepath: str,
-    current_peak_db: float,
-    target_peak_db: float,
-    backup: bool = False,
-) -> bool:
+def peak_gain_filter(current_peak_db: float, target_peak_db: float) -> str:
     """
-    Normalize a short file by scaling its peak to the target level.
+    Build the filter that scales a short file's peak to the target level.
     Uses ffmpeg's volume filter with a simple gain adjustment.
     """
-    ext = os.path.splitext(filepath)[1].lower()
     gain_db = target_peak_db - current_peak_db
 
     # Apply gain and hard-limit to prevent any overshoot
-    af = f"volume={gain_db}dB,alimiter=limit={TRUE_PEAK_LIMIT}dB:attack=0.1:release=50"
-
-    return _apply_filter(filepath, af, ext, backup)
+    return f"volume={gain_db}dB,alimiter=limit={TRUE_PEAK_LIMIT}dB:attack=0.1:release=50"
 
 
 # ---------------------------------------------------------------------------
 # Shared filter application
 # ---------------------------------------------------------------------------
 
-def _apply_filter(filepath: str, af: str, ext: str, backup: bool) -> bool:
-    """Apply an ffmpeg audio filter, writing to a temp file then replacing the original."""
-    codec_args = get_codec_args(ext)
+def _apply_filter(
+    filepath: str,
+    af: str,
+    ext: str,
+    backup: bool,
+    extra_args: list[str] | None = None,
+    accept: Callable[[dict | None], bool] | None = None,
+    measure_output: bool = False,
+) -> tuple[bool, dict | None]:
+    """
+    Apply an ffmpeg audio filter, writing to a temp file then replacing the original.
 
-    fd, tmp_path = tempfile.mkstemp(suffix=ext)
-    os.close(fd)
+    Returns (ok, stats). With measure_output, stats is a loudnorm report measured
+    on the filtered audio during the same run (its input_i/input_tp are the new
+    file's levels); otherwise it is the report of a loudnorm with
+    print_format=json inside af, or None. If accept is given, the original is
+    only replaced when accept(stats) is true.
+    """
+    tmp_path, fd = _open_temp_output(filepath, ext)
 
     try:
         cmd = [
-            "ffmpeg", "-y", "-i", filepath,
-            "-af", af,
-            *codec_args,
-            tmp_path,
+            "ffmpeg", "-y", *_log_args(reports=measure_output or "print_format=json" in af),
+            *_filter_thread_args(),
+            *_input_args(filepath),
+            "-filter_complex", _filter_chain(0, af, measure_output),
+            *_output_args(0, ext, tmp_path, measure_output, extra_args),
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        returncode, stderr = run_ffmpeg(cmd, pass_fds=() if fd is None else (fd,))
 
-        if result.returncode != 0:
-            os.unlink(tmp_path)
-            return False
+        if returncode != 0:
+            return False, None
+
+        reports = parse_loudnorm_reports(stderr)
+        stats = reports[-1] if reports else None
+
+        if accept is not None and not accept(stats):
+            return False, stats
+
+        _replace_original(tmp_path, filepath, backup, fd)
+        return True, stats
+
+    finally:
+        _discard_temp_output(tmp_path, fd)
+
+
+def apply_filters_batch(
+    jobs: list[tuple[str, str]],
+    backup: bool,
+    measure_output: bool = False,
+) -> list[tuple[bool, dict | None]]:
+    """
+    Apply one filter per file for a list of (filepath, af) jobs in a single ffmpeg
+    run: every file is a separate input with its own filter chain, codec and output,
+    so process startup and codec/library initialization are paid once per batch.
+
+    Returns one (ok, stats) per job, like _apply_filter. If the combined run fails
+    (e.g. one unreadable file), each job is retried on its own so only the bad
+    file is reported as failed.
+    """
+    def one_by_one() -> list[tuple[bool, dict | None]]:
+        return [
+            _apply_filter(
+                filepath, af, os.path.splitext(filepath)[1].lower(), backup,
+                measure_output=measure_output,
+            )
+            for filepath, af in jobs
+        ]
+
+    if len(jobs) <= 1:
+        return one_by_one()
+
+    outputs = []
+    scripts = []
+    try:
+        cmd = ["ffmpeg", "-y", *_log_args(reports=measure_output), *_filter_thread_args()]
+        for filepath, _af in jobs:
+            cmd += _input_args(filepath)
+
+        graph = ";".join(
+            _filter_chain(i, af, measure_output) for i, (_filepath, af) in enumerate(jobs)
+        )
+        cmd += _filter_complex_args(graph, scripts)
+
+        for i, (filepath, _af) in enumerate(jobs):
+            ext = os.path.splitext(filepath)[1].lower()
+            tmp_path, fd = _open_temp_output(filepath, ext)
+            outputs.append((tmp_path, fd))
+            cmd += _output_args(i, ext, tmp_path, measure_output)
+
+        returncode, stderr = run_ffmpeg(
+            cmd, pass_fds=tuple(fd for _tmp_path, fd in outputs if fd is not None)
+        )
 
-        if backup:
-            bak_path = filepath + ".bak"
+        if returncode != 0:
+            for tmp_path, fd in outputs:
+                _discard_temp_output(tmp_path, fd)
+            outputs = []
+            return one_by_one()
+
+        # One measurement branch per chain, so reports line up with jobs
+        reports = parse_loudnorm_reports(stderr) if measure_output else []
+        if len(reports) != len(jobs):
+            reports = [None] * len(jobs)
+
+        for (filepath, _af), (tmp_path, fd) in zip(jobs, outputs):
+            _replace_original(tmp_path, filepath, backup, fd)
+        return [(True, stats) for stats in reports]
+
+    finally:
+        for tmp_path, fd in outputs:
+            _discard_temp_output(tmp_path, fd)
+        for script_path in scripts:
+            if os.path.exists(script_path):
+                os.unlink(script_path)
+
+
+def _filter_chain(index: int, af: str, measure_output: bool) -> str:
+    """
+    filter_complex chain for input `index`, producing [out<index>]. With
+    measure_output, the filtered audio is also split into a loudnorm branch
+    [post<index>] so the result is measured without decoding the file again.
+    """
+    if not measure_output:
+        return f"[{index}:a]{af}[out{index}]"
+    # loudnorm only accepts 192 kHz; resample inside the branch, otherwise format
+    # negotiation through asplit would push 192 kHz onto the written file too
+    return (
+        f"[{index}:a]{af},asplit=2[out{index}][meas{index}];"
+        f"[meas{index}]aresample=192000,loudnorm=print_format=json[post{index}]"
+    )
+
+
+def _output_args(
+    index: int,
+    ext: str,
+    tmp_path: str,
+    measure_output: bool,
+    extra_args: list[str] | None = None,
+) -> list[str]:
+    """ffmpeg output options writing [out<index>] to tmp_path (and [post<index>] to null)."""
+    args = [
+        "-map", f"[out{index}]",
+        # Carry over this input's tags (global and per-stream, e.g. Vorbis comments);
+        # with several inputs ffmpeg would otherwise copy the first one's everywhere
+        "-map_metadata", str(index), "-map_metadata:s:0", f"{index}:s:a:0",
+        # ...except the stale stream encoder tag, so ffmpeg writes the one actually used
+        "-metadata:s:a:0", "encoder=",
+        *(extra_args or []),
+        *_codec_thread_args(),
+        *get_codec_args(ext),
+        tmp_path,
+    ]
+    if measure_output:
+        args += ["-map", f"[post{index}]", "-f", "null", "-"]
+    return args
+
+
+def _open_temp_output(filepath: str, ext: str) -> tuple[str, int | None]:
+    """
+    Create the file ffmpeg writes filepath's new contents into, returning
+    (tmp_path, fd). On Linux this is an unnamed O_TMPFILE inode in filepath's
+    directory, held open as fd. ffmpeg inherits the same fd number and writes
+    through tmp_path, /proc/self/fd/<fd>, so nothing appears in the directory
+    unless the encode succeeds, even if ffmpeg or this script is killed.
+    Elsewhere (or on filesystems without O_TMPFILE) it's a named file from
+    _make_temp_path and fd is None. Release with _discard_temp_output either way.
+    """
+    if hasattr(os, "O_TMPFILE") and os.path.isdir("/proc/self/fd"):
+        try:
+            fd = os.open(os.path.dirname(filepath) or ".", os.O_TMPFILE | os.O_WRONLY, 0o600)
+        except OSError:  # e.g. EOPNOTSUPP on filesystems that don't implement it
+            pass
+        else:
+            # /proc rather than /dev/fd, which minimal chroots/containers may lack
+            return f"/proc/self/fd/{fd}", fd
+    return _make_temp_path(filepath, ext), None
+
+
+def _discard_temp_output(tmp_path: str, fd: int | None) -> None:
+    """Release a temp output; an unnamed one that was never linked in is freed."""
+    if fd is not None:
+        os.close(fd)
+    elif os.path.exists(tmp_path):
+        os.unlink(tmp_path)
+
+
+def _make_temp_path(filepath: str, ext: str) -> str:
+    """
+    Create an empty temp file next to filepath for ffmpeg to write into. Same
+    directory means same filesystem, so the final os.replace is a rename rather
+    than a copy. The dot prefix hides leftovers from Godot and find_audio_files.
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=TEMP_PREFIX, suffix=ext, dir=os.path.dirname(filepath) or "."
+    )
+    os.close(fd)
+    return tmp_path
+
+
+def _replace_original(tmp_path: str, filepath: str, backup: bool, fd: int | None = None) -> None:
+    """
+    Move a finished temp file over the original, keeping a .bak copy if requested.
+    With fd (an O_TMPFILE output from _open_temp_output) the inode is first linked
+    in under a temp name, since link() can't replace an existing file.
+    """
+    # mkstemp and O_TMPFILE create files as 0600; keep the original's permissions
+    if fd is None:
+        shutil.copymode(filepath, tmp_path)
+    else:
+        os.fchmod(fd, stat.S_IMODE(os.stat(filepath).st_mode))
+
+    if backup:
+        bak_path = filepath + ".bak"
+        if os.path.lexists(bak_path):
+            os.remove(bak_path)
+        try:
+            # The original inode becomes the backup once it's replaced below
+            os.link(filepath, bak_path)
+        except OSError:
             shutil.copy2(filepath, bak_path)
 
-        shutil.move(tmp_path, filepath)
-        return True
+    if fd is None:
+        os.replace(tmp_path, filepath)
+        return
 
-    except Exception:
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
-        raise
+    directory = os.path.dirname(filepath) or "."
+    link_name = TEMP_PREFIX + os.urandom(8).hex()
+    dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        # Passing dir_fd makes os.link use linkat(AT_SYMLINK_FOLLOW); plain link()
+        # would try to link the /proc magic symlink itself and fail with EXDEV
+        os.link(f"/proc/self/fd/{fd}", link_name, dst_dir_fd=dir_fd)
+        try:
+            os.replace(link_name, filepath, src_dir_fd=dir_fd)
+        except OSError:
+            os.unlink(link_name, dir_fd=dir_fd)
+            raise
+    finally:
+        os.close(dir_fd)
 
 
 # ---------------------------------------------------------------------------
@@ -237,6 +794,288 @@ def format_db(value: float) -> str:
     return f"{value:+.1f} dB"
 
 
+# ---------------------------------------------------------------------------
+# Measurement cache
+# ---------------------------------------------------------------------------
+
+def load_cache(cache_path: str) -> dict:
+    """Load the measurement cache, or start empty if it's missing or unreadable."""
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_cache(cache_path: str, cache: dict) -> None:
+    """Write the measurement cache atomically (temp file + rename), if possible."""
+    cache_dir = os.path.dirname(cache_path)
+    if not os.path.isdir(cache_dir):
+        return
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(prefix=TEMP_PREFIX, suffix=".json", dir=cache_dir)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Not cached (e.g. read-only assets dir); files are re-measured next run
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+def file_signature(filepath: str) -> list[int] | None:
+    """
+    Identify a file's current contents by (mtime_ns, size) for the cache, or
+    None if it can't be stat'ed (e.g. deleted mid-run).
+    """
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def is_cache_hit(entry, filepath: str, target: float, peak_target: float) -> bool:
+    """
+    Whether a cache entry still matches the file and is within target. The cache
+    is advisory, so a malformed entry just counts as a miss.
+    """
+    if not isinstance(entry, dict):
+        return False
+    levels = entry.get("levels")
+    signature = file_signature(filepath)
+    return (
+        signature is not None
+        and entry.get("signature") == signature
+        and isinstance(levels, dict)
+        and is_within_target(levels, target, peak_target)
+    )
+
+
+def is_within_target(levels: dict, target: float, peak_target: float) -> bool:
+    """Whether measured levels already pass the same tolerance checks plan_file applies."""
+    if is_lufs_valid(levels):
+        return abs(float(levels["input_i"]) - target) < LUFS_TOLERANCE
+    current_peak = get_peak_db(levels)
+    return current_peak is not None and abs(current_peak - peak_target) < PEAK_TOLERANCE
+
+
+# ---------------------------------------------------------------------------
+# Per-file processing
+# ---------------------------------------------------------------------------
+
+def normalize_fast(
+    filepath: str,
+    target: float,
+    backup: bool,
+) -> tuple[str, list[str], dict | None] | None:
+    """
+    --fast: measure and normalize in one loudnorm decode.
+    Returns (status, log_lines, levels), or None when the file is too short for
+    LUFS, the single pass missed the target (or ffmpeg failed) and it must go
+    through the two-pass flow instead.
+    """
+    ok, stats = normalize_lufs_single_pass(filepath, target, backup=backup)
+    if stats is None or not is_lufs_valid(stats):
+        return None
+
+    current_lufs = float(stats["input_i"])
+    if not ok and abs(current_lufs - target) >= LUFS_TOLERANCE:
+        # Output was off target and discarded; volume + alimiter gets it exact
+        return None
+
+    log = []
+    input_tp = stats.get("input_tp", "?")
+    log.append(f"Current: {current_lufs:+.1f} LUFS  (peak: {input_tp} dBTP)")
+    if not ok:
+        log.append("Already within LUFS target — skipping")
+        return "skipped", log, stats
+    log.append(f"Normalized (single pass): {format_lufs(stats.get('output_i'))}")
+    levels = {"input_i": stats.get("output_i"), "input_tp": stats.get("output_tp")}
+    return "processed", log, levels
+
+
+def plan_file(
+    filepath: str,
+    measurements: dict | None,
+    target: float,
+    peak_target: float,
+    dry_run: bool,
+) -> tuple[str | None, list[str], tuple[str, str] | None, dict | None]:
+    """
+    Decide what to do with a file given its first-pass measurements.
+    Returns (status, log_lines, job, levels). When the file still needs a gain
+    change, status is None and job is (kind, af) with kind "lufs" or "peak";
+    otherwise job is None and status is final ("processed", "skipped" or "failed").
+    levels is the measurement of the file as it now is on disk, when known.
+    """
+    log = []
+
+    if measurements is None:
+        log.append("FAILED to measure — skipping")
+        return "failed", log, None, None
+
+    input_tp = measurements.get("input_tp", "?")
+    current_peak = get_peak_db(measurements)
+
+    if is_lufs_valid(measurements):
+        # ---- LUFS path (normal-length files) ----
+        current_lufs = float(measurements["input_i"])
+        log.append(f"Current: {current_lufs:+.1f} LUFS  (peak: {input_tp} dBTP)")
+
+        if abs(current_lufs - target) < LUFS_TOLERANCE:
+            log.append("Already within LUFS target — skipping")
+            return "skipped", log, None, measurements
+
+        gain = target - current_lufs
+        log.append(f"Gain: {format_db(gain)}")
+
+        if dry_run:
+            log.append(f"Would normalize to {target} LUFS")
+            return "processed", log, None, None
+
+        return None, log, ("lufs", lufs_gain_filter(current_lufs, target)), None
+
+    elif current_peak is not None:
+        # ---- Peak path (short files) ----
+        log.append(f"Current: too short for LUFS  (peak: {current_peak:+.1f} dBFS)")
+
+        if abs(current_peak - peak_target) < PEAK_TOLERANCE:
+            log.append("Already within peak target — skipping")
+            return "skipped", log, None, measurements
+
+        gain = peak_target - current_peak
+        log.append(f"Gain: {format_db(gain)}")
+
+        if dry_run:
+            log.append(f"Would peak-normalize to {peak_target} dBFS")
+            return "processed", log, None, None
+
+        return None, log, ("peak", peak_gain_filter(current_peak, peak_target)), None
+
+    else:
+        log.append("No valid LUFS or peak measurement — skipping")
+        return "failed", log, None, None
+
+
+def report_applied(
+    kind: str,
+    ok: bool,
+    post: dict | None,
+    target: float,
+    peak_target: float,
+    verify: bool,
+    log: list[str],
+) -> str:
+    """
+    Log the outcome of a planned gain change and return the file's final status.
+    post is the loudnorm report measured on the new audio during the encode (verify only).
+    """
+    if kind == "lufs":
+        if not ok:
+            log.append("FAILED to normalize")
+            return "failed"
+        if not verify:
+            log.append(f"Normalized to {target} LUFS")
+        elif post and is_lufs_valid(post):
+            log.append(f"Normalized: {float(post['input_i']):+.1f} LUFS")
+        else:
+            log.append("Normalized (could not verify)")
+        return "processed"
+
+    if not ok:
+        log.append("FAILED to peak-normalize")
+        return "failed"
+    v_peak = get_peak_db(post) if post else None
+    if not verify:
+        log.append(f"Peak-normalized to {peak_target} dBFS")
+    elif v_peak is not None:
+        log.append(f"Peak-normalized: {v_peak:+.1f} dBFS")
+    else:
+        log.append("Peak-normalized (could not verify)")
+    return "processed"
+
+
+def process_batch(
+    filepaths: list[str],
+    target: float,
+    peak_target: float,
+    dry_run: bool,
+    backup: bool,
+    fast: bool = False,
+    verify: bool = False,
+) -> list[tuple[str, str, list[str], dict | None]]:
+    """
+    Measure and (unless dry_run) normalize a group of files.
+    Returns (filepath, status, log_lines, levels) per file, where status is
+    "processed", "skipped" or "failed" and levels (for the cache) is the file's
+    current measurement when known. Output is collected rather than printed so
+    parallel workers don't interleave. All gain changes in the group share one
+    ffmpeg run, as does the measurement pass.
+    """
+    results = [None] * len(filepaths)
+    to_measure = []
+    pending = []
+
+    for index, filepath in enumerate(filepaths):
+        outcome = normalize_fast(filepath, target, backup) if fast and not dry_run else None
+        if outcome is None:
+            to_measure.append(index)
+        else:
+            results[index] = (filepath, *outcome)
+
+    # Pass 1: Measure
+    measured = measure_loudness_batch([filepaths[index] for index in to_measure], target)
+
+    for index, measurements in zip(to_measure, measured):
+        filepath = filepaths[index]
+        status, log, job, levels = plan_file(filepath, measurements, target, peak_target, dry_run)
+        results[index] = (filepath, status, log, levels)
+        if job is not None:
+            pending.append((index, job))
+
+    jobs = [(filepaths[index], af) for index, (_kind, af) in pending]
+    outcomes = apply_filters_batch(jobs, backup, measure_output=verify)
+
+    for (index, (kind, _af)), (ok, post) in zip(pending, outcomes):
+        filepath, _status, log, _levels = results[index]
+        status = report_applied(kind, ok, post, target, peak_target, verify, log)
+        # post (verify only) measured the new audio, so it describes the file now on disk
+        results[index] = (filepath, status, log, post if ok else None)
+
+    return results
+
+
+def iter_results(audio_files: list[str], jobs: int, batch_size: int, task_args: tuple):
+    """
+    Yield (filepath, status, log_lines, levels) for each file as its batch finishes.
+    Runs in-process when jobs == 1, otherwise fans batches out over a process
+    pool — each file is independent and the work is dominated by ffmpeg subprocesses.
+    """
+    # Keep every worker busy: don't let batching leave the pool idle on small runs
+    per_worker = -(-len(audio_files) // jobs)
+    size = max(1, min(batch_size, MAX_BATCH_SIZE, per_worker))
+    batches = [audio_files[i:i + size] for i in range(0, len(audio_files), size)]
+
+    if jobs == 1 or len(batches) <= 1:
+        set_parallel_jobs(1)
+        for batch in batches:
+            yield from process_batch(batch, *task_args)
+        return
+
+    workers = min(jobs, len(batches))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=set_parallel_jobs,
+        initargs=(workers,),
+    ) as executor:
+        futures = [executor.submit(process_batch, batch, *task_args) for batch in batches]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -261,6 +1100,34 @@ def main():
         "--backup", action="store_true",
         help="Keep original files as .bak before overwriting"
     )
+    parser.add_argument(
+        "--fast", action="store_true",
+        help="Single-pass loudnorm (one decode per file; files it leaves off target are redone in two passes)"
+    )
+    parser.add_argument(
+        "--verify", action="store_true",
+        help="Report each normalized file's resulting level (measured during the encode)"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help=f"Re-measure every file, ignoring and not updating {CACHE_PATH}"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=os.cpu_count() or 1,
+        help="Number of files to process in parallel (default: CPU count)"
+    )
+    parser.add_argument(
+        "--serial", action="store_true",
+        help="Process files one at a time (same as --jobs 1; can be faster on slow HDDs)"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+        help=f"Files per ffmpeg run, to amortize startup (default: {DEFAULT_BATCH_SIZE}, max: {MAX_BATCH_SIZE})"
+    )
+    parser.add_argument(
+        "--no-verify-ffmpeg", action="store_true",
+        help="Only check that ffmpeg is on PATH, without running it"
+    )
     parser.add_argument(
         "paths", nargs="*",
         help="Specific files or directories to process (default: assets/audio/)"
@@ -268,7 +1135,7 @@ def main():
     args = parser.parse_args()
 
     # Check ffmpeg
-    if not check_ffmpeg():
+    if not check_ffmpeg(verify=not args.no_verify_ffmpeg):
         print("Error: ffmpeg is not installed or not on PATH.", file=sys.stderr)
         print("Install it from https://ffmpeg.org/download.html", file=sys.stderr)
         sys.exit(1)
@@ -304,101 +1171,67 @@ def main():
     target = args.target
     peak_target = args.peak
     mode = "DRY RUN" if args.dry_run else "NORMALIZING"
+    jobs = 1 if args.serial else max(1, args.jobs)
 
     print(f"LUFS target:  {target} LUFS  (files >= 400ms)")
     print(f"Peak target:  {peak_target} dBFS  (short files)")
     print(f"Peak ceiling: {TRUE_PEAK_LIMIT} dBTP")
+    if args.fast:
+        mode += " (single pass)"
     print(f"Mode: {mode}")
     print(f"Files: {len(audio_files)}")
+    print(f"Jobs: {jobs}")
     print("-" * 60)
 
-    success_count = 0
-    skip_count = 0
-    fail_count = 0
+    counts = {"processed": 0, "skipped": 0, "failed": 0}
 
-    for filepath in audio_files:
-        rel_path = os.path.relpath(filepath, project_root)
-
-        # Pass 1: Measure
-        print(f"\n  {rel_path}")
-        measurements = measure_loudness(filepath, target)
-
-        if measurements is None:
-            print(f"    FAILED to measure — skipping")
-            fail_count += 1
-            continue
-
-        input_tp = measurements.get("input_tp", "?")
-        current_peak = get_peak_db(measurements)
-
-        if is_lufs_valid(measurements):
-            # ---- LUFS path (normal-length files) ----
-            current_lufs = float(measurements["input_i"])
-            print(f"    Current: {current_lufs:+.1f} LUFS  (peak: {input_tp} dBTP)")
-
-            if abs(current_lufs - target) < LUFS_TOLERANCE:
-                print(f"    Already within LUFS target — skipping")
-                skip_count += 1
-                continue
-
-            gain = target - current_lufs
-            print(f"    Gain: {format_db(gain)}")
-
-            if args.dry_run:
-                print(f"    Would normalize to {target} LUFS")
-                success_count += 1
-                continue
-
-            ok = normalize_lufs(filepath, current_lufs, target, backup=args.backup)
-            if ok:
-                verify = measure_loudness(filepath, target)
-                if verify and is_lufs_valid(verify):
-                    print(f"    Normalized: {float(verify['input_i']):+.1f} LUFS")
-                else:
-                    print(f"    Normalized (could not verify)")
-                success_count += 1
-            else:
-                print(f"    FAILED to normalize")
-                fail_count += 1
-
-        elif current_peak is not None:
-            # ---- Peak path (short files) ----
-            print(f"    Current: too short for LUFS  (peak: {current_peak:+.1f} dBFS)")
-
-            if abs(current_peak - peak_target) < PEAK_TOLERANCE:
-                print(f"    Already within peak target — skipping")
-                skip_count += 1
-                continue
-
-            gain = peak_target - current_peak
-            print(f"    Gain: {format_db(gain)}")
-
-            if args.dry_run:
-                print(f"    Would peak-normalize to {peak_target} dBFS")
-                success_count += 1
-                continue
-
-            ok = normalize_peak(filepath, current_peak, peak_target, backup=args.backup)
-            if ok:
-                verify = measure_loudness(filepath, target)
-                v_peak = get_peak_db(verify) if verify else None
-                if v_peak is not None:
-                    print(f"    Peak-normalized: {v_peak:+.1f} dBFS")
-                else:
-                    print(f"    Peak-normalized (could not verify)")
-                success_count += 1
-            else:
-                print(f"    FAILED to peak-normalize")
-                fail_count += 1
+    # Measured levels don't depend on the target, so entries are keyed by path and
+    # file signature only and re-checked against the current targets
+    cache_path = os.path.join(project_root, CACHE_PATH)
+    cache = {} if args.no_cache else load_cache(cache_path)
+
+    def cache_key(filepath: str) -> str:
+        return os.path.relpath(filepath, project_root).replace("\\", "/")
 
+    to_process = []
+    for filepath in audio_files:
+        if is_cache_hit(cache.get(cache_key(filepath)), filepath, target, peak_target):
+            print(f"\n  {os.path.relpath(filepath, project_root)}")
+            print("    Cached — already within target, skipping")
+            counts["skipped"] += 1
         else:
-            print(f"    No valid LUFS or peak measurement — skipping")
-            fail_count += 1
-            continue
+            to_process.append(filepath)
+
+    task_args = (target, peak_target, args.dry_run, args.backup, args.fast, args.verify)
+    try:
+        for filepath, status, log_lines, levels in iter_results(
+            to_process, jobs, args.batch_size, task_args
+        ):
+            rel_path = os.path.relpath(filepath, project_root)
+            print(f"\n  {rel_path}")
+            for line in log_lines:
+                print(f"    {line}")
+            counts[status] += 1
+
+            signature = file_signature(filepath)
+            if levels is not None and signature is not None:
+                cache[cache_key(filepath)] = {
+                    "signature": signature,
+                    "levels": {key: levels.get(key) for key in ("input_i", "input_tp")},
+                }
+            else:
+                cache.pop(cache_key(filepath), None)
+    finally:
+        # Keep what was measured even if the run is interrupted
+        if not args.no_cache:
+            save_cache(cache_path, cache)
 
     # Summary
     print("\n" + "-" * 60)
-    print(f"Done. {success_count} processed, {skip_count} skipped, {fail_count} failed.")
+    print(
+        f"Done. {counts['processed']} processed, {counts['skipped']} skipped, "
+        f"{counts['failed']} failed."
+    )
 
 
 if __name__ == "__main__":